@@ -16,12 +16,13 @@ from pymor.tools.random import new_rng
 from pymor.vectorarrays.constructions import cat_arrays
 
 
-@defaults('lradi_tol', 'lradi_maxiter', 'lradi_shifts', 'projection_shifts_init_maxiter',
+@defaults('lradi_tol', 'lradi_maxiter', 'lradi_shifts', 'lradi_max_cached_ops', 'projection_shifts_init_maxiter',
           'projection_shifts_subspace_columns',
           'wachspress_large_ritz_num', 'wachspress_small_ritz_num', 'wachspress_tol')
 def lyap_lrcf_solver_options(lradi_tol=1e-10,
                              lradi_maxiter=500,
                              lradi_shifts='projection_shifts',
+                             lradi_max_cached_ops=20,
                              projection_shifts_init_maxiter=20,
                              projection_shifts_subspace_columns=6,
                              wachspress_large_ritz_num=50,
@@ -37,6 +38,8 @@ def lyap_lrcf_solver_options(lradi_tol=1e-10,
         See :func:`solve_lyap_lrcf`.
     lradi_shifts
         See :func:`solve_lyap_lrcf`.
+    lradi_max_cached_ops
+        See :func:`solve_lyap_lrcf`.
     projection_shifts_init_maxiter
         See :func:`projection_shifts_init`.
     projection_shifts_subspace_columns
@@ -56,6 +59,7 @@ def lyap_lrcf_solver_options(lradi_tol=1e-10,
                       'tol': lradi_tol,
                       'maxiter': lradi_maxiter,
                       'shifts': lradi_shifts,
+                      'max_cached_ops': lradi_max_cached_ops,
                       'shift_options':
                       {'projection_shifts': {'type': 'projection_shifts',
                                              'init_maxiter': projection_shifts_init_maxiter,
@@ -77,6 +81,13 @@ def solve_lyap_lrcf(A, E, B, trans=False, cont_time=True, options=None):
 
     This function uses the low-rank ADI iteration as described in Algorithm 4.3 in :cite:`PK16`.
 
+    .. note::
+        While the same set of shifts is reused cyclically (always the case for Wachspress
+        shifts), the assembled shifted operators are kept, so that factorizations computed by
+        `apply_inverse` can be reused. For sparse matrices, this means that one sparse LU
+        decomposition is stored per shift. At most `options['max_cached_ops']` operators are
+        kept (see :func:`lyap_lrcf_solver_options`). Set it to `0` to disable caching.
+
     Parameters
     ----------
     A
@@ -123,40 +134,64 @@ def solve_lyap_lrcf(A, E, B, trans=False, cont_time=True, options=None):
     j = 0
     j_shift = 0
     shifts = init_shifts(A, E, W, shift_options)
-    res = np.linalg.norm(W.gramian(), ord=2)
+    res = _gramian_norm(W)
     init_res = res
     Btol = res * options['tol']
 
+    # assembled shifted operators are kept while the same shifts are cycled,
+    # so that factorizations computed by apply_inverse can be reused
+    shifted_ops = {}
+    cycling = iteration_shifts is cycle_shifts
+
     while res > Btol and j < options['maxiter']:
+        AaE = shifted_ops.get(j_shift)
+        if AaE is None:
+            if shifts[j_shift].imag == 0:
+                AaE = A + shifts[j_shift].real * E
+            else:
+                AaE = A + shifts[j_shift] * E
+            AaE = AaE.assemble()
+            if trans:
+                AaE = AaE.H
+            if cycling and len(shifted_ops) < options['max_cached_ops']:
+                shifted_ops[j_shift] = AaE
         if shifts[j_shift].imag == 0:
-            AaE = A + shifts[j_shift].real * E
+            V = AaE.apply_inverse(W)
             if not trans:
-                V = AaE.apply_inverse(W)
-                W -= E.apply(V) * (2 * shifts[j_shift].real)
+                W.axpy(-2 * shifts[j_shift].real, E.apply(V))
             else:
-                V = AaE.apply_inverse_adjoint(W)
-                W -= E.apply_adjoint(V) * (2 * shifts[j_shift].real)
-            Z.append(V * np.sqrt(-2 * shifts[j_shift].real))
+                W.axpy(-2 * shifts[j_shift].real, E.apply_adjoint(V))
+            Z.append(V)
+            Z[-len(V):].scal(np.sqrt(-2 * shifts[j_shift].real))
             j += 1
         else:
-            AaE = A + shifts[j_shift] * E
             gs = -4 * shifts[j_shift].real
             d = shifts[j_shift].real / shifts[j_shift].imag
             if not trans:
                 V = AaE.apply_inverse(W)
-                W += E.apply(V.real + V.imag * d) * gs
             else:
-                V = AaE.apply_inverse_adjoint(W).conj()
-                W += E.apply_adjoint(V.real + V.imag * d) * gs
+                V = AaE.apply_inverse(W).conj()
+            V_real, V_imag = V.real, V.imag
+            V_real.axpy(d, V_imag)
+            if not trans:
+                W.axpy(gs, E.apply(V_real))
+            else:
+                W.axpy(gs, E.apply_adjoint(V_real))
             g = np.sqrt(gs)
-            Z.append((V.real + V.imag * d) * g)
-            Z.append(V.imag * (g * np.sqrt(d**2 + 1)))
+            V_real.scal(g)
+            V_imag.scal(g * np.sqrt(d**2 + 1))
+            Z.append(V_real)
+            Z.append(V_imag)
             j += 2
         j_shift += 1
-        res = np.linalg.norm(W.gramian(), ord=2)
+        res = _gramian_norm(W)
         logger.info(f'Relative residual at step {j}: {res/init_res:.5e}')
         if j_shift >= shifts.size:
-            shifts = iteration_shifts(A, E, V, Z, shifts, shift_options)
+            new_shifts = iteration_shifts(A, E, V, Z, shifts, shift_options)
+            cycling = new_shifts is shifts
+            if not cycling:
+                shifted_ops.clear()
+            shifts = new_shifts
             j_shift = 0
 
     if res > Btol:
@@ -166,6 +201,16 @@ def solve_lyap_lrcf(A, E, B, trans=False, cont_time=True, options=None):
     return Z
 
 
+def _gramian_norm(W):
+    """Compute the spectral norm of the Gramian of W.
+
+    Since the Gramian is symmetric positive semidefinite, its spectral norm is its largest
+    eigenvalue, which is computed without the full eigendecomposition.
+    """
+    G = W.gramian()
+    return spla.eigh(G, eigvals_only=True, overwrite_a=True, subset_by_index=[len(G) - 1, len(G) - 1])[0]
+
+
 def projection_shifts_init(A, E, B, shift_options):
     """Find starting projection shifts.
 
@@ -193,7 +238,7 @@ def projection_shifts_init(A, E, B, shift_options):
     rng = new_rng(0)
     for i in range(shift_options['init_maxiter']):
         Q = gram_schmidt(B, atol=0, rtol=0)
-        shifts = spla.eigvals(A.apply2(Q, Q), E.apply2(Q, Q))
+        shifts = _projected_eigvals(A, E, Q)
         shifts = shifts[shifts.real < 0]
         if shifts.size == 0:
             # use random subspace instead of span{B} (with same dimensions)
@@ -240,9 +285,8 @@ def projection_shifts(A, E, V, Z, prev_shifts, shift_options):
         num_columns = shift_options['subspace_columns'] * len(V)
         Q = gram_schmidt(Z[-num_columns:], atol=0, rtol=0)
 
-    shifts = spla.eigvals(A.apply2(Q, Q), E.apply2(Q, Q))
-    shifts = shifts[shifts.real < 0]
-    shifts = shifts[shifts.imag >= 0]
+    shifts = _projected_eigvals(A, E, Q)
+    shifts = shifts[(shifts.real < 0) & (shifts.imag >= 0)]
     if shifts.size == 0:
         return prev_shifts
     else:
@@ -251,6 +295,39 @@ def projection_shifts(A, E, V, Z, prev_shifts, shift_options):
         return shifts
 
 
+def _projected_eigvals(A, E, Q):
+    """Compute the eigenvalues of the Galerkin projection of (A, E) onto span(Q).
+
+    If the projected E is Hermitian positive definite, the generalized eigenvalue problem is
+    reduced to a standard one using its Cholesky factor, which is cheaper than the QZ algorithm.
+
+    Parameters
+    ----------
+    A
+        The |Operator| A.
+    E
+        The |Operator| E.
+    Q
+        A |VectorArray| with orthonormal vectors from `A.source`.
+
+    Returns
+    -------
+    A |NumPy array| containing the eigenvalues.
+    """
+    Ap = A.apply2(Q, Q)
+    Ep = E.apply2(Q, Q)
+    if spla.norm(Ep - Ep.conj().T) <= 1e-10 * spla.norm(Ep):
+        try:
+            L = spla.cholesky(Ep, lower=True)
+        except spla.LinAlgError:
+            pass
+        else:
+            Ap = spla.solve_triangular(L, Ap, lower=True, overwrite_b=True)
+            Ap = spla.solve_triangular(L, Ap.conj().T, lower=True, overwrite_b=True).conj().T
+            return spla.eigvals(Ap, overwrite_a=True)
+    return spla.eig(Ap, Ep, left=False, right=False, overwrite_a=True, overwrite_b=True)
+
+
 def wachspress_shifts_init(A, E, B, shift_options):
     """Compute optimal shifts for symmetric matrices.
 
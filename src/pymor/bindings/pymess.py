@@ -555,8 +555,9 @@ class LyapunovEquation(pymess.Equation):
         super().__init__(name='LyapunovEquation', opt=opt, dim=A.source.dim)
         self.a = A
         self.e = E
-        self.rhs = B.to_numpy().T
+        self.rhs = np.asfortranarray(B.to_numpy().T)
         self.p = []
+        self._shifted_ops = {}
 
     def ax_apply(self, op, y):
         y = self.a.source.from_numpy(y.T)
@@ -614,17 +615,22 @@ class LyapunovEquation(pymess.Equation):
 
     def apeinv_apply(self, op, p, idx_p, y):
         y = self.a.source.from_numpy(y.T)
-        e = IdentityOperator(self.a.source) if self.e is None else self.e
-
-        if p.imag == 0:
-            ape = self.a + p.real * e
-        else:
-            ape = self.a + p * e
+        cached_p, ape = self._shifted_ops.get((op, idx_p), (None, None))
+        if cached_p != p:
+            e = IdentityOperator(self.a.source) if self.e is None else self.e
+            if p.imag == 0:
+                ape = self.a + p.real * e
+            else:
+                ape = self.a + p * e
+            ape = ape.assemble()
+            if op != pymess.MESS_OP_NONE:
+                ape = ape.H
+            self._shifted_ops[op, idx_p] = (p, ape)
 
-        if op == pymess.MESS_OP_NONE:
+        if op == pymess.MESS_OP_NONE or p.imag == 0:
             x = ape.apply_inverse(y)
         else:
-            x = ape.apply_inverse_adjoint(y.conj()).conj()
+            x = ape.apply_inverse(y.conj()).conj()
         return x.to_numpy().T
 
     def parameter(self, arp_p, arp_m, B=None, K=None):
@@ -674,10 +680,11 @@ class RiccatiEquation(pymess.Equation):
         super().__init__(name='RiccatiEquation', opt=opt, dim=A.source.dim)
         self.a = A
         self.e = E
-        self.b = B.to_numpy().T
-        self.c = C.to_numpy()
+        self.b = np.asfortranarray(B.to_numpy().T)
+        self.c = np.ascontiguousarray(C.to_numpy())
         self.rhs = self.b if opt.type == pymess.MESS_OP_NONE else self.c.T
         self.p = []
+        self._shifted_ops = {}
 
     def ax_apply(self, op, y):
         y = self.a.source.from_numpy(y.T)
@@ -735,17 +742,22 @@ class RiccatiEquation(pymess.Equation):
 
     def apeinv_apply(self, op, p, idx_p, y):
         y = self.a.source.from_numpy(y.T)
-        e = IdentityOperator(self.a.source) if self.e is None else self.e
-
-        if p.imag == 0:
-            ape = self.a + p.real * e
-        else:
-            ape = self.a + p * e
+        cached_p, ape = self._shifted_ops.get((op, idx_p), (None, None))
+        if cached_p != p:
+            e = IdentityOperator(self.a.source) if self.e is None else self.e
+            if p.imag == 0:
+                ape = self.a + p.real * e
+            else:
+                ape = self.a + p * e
+            ape = ape.assemble()
+            if op != pymess.MESS_OP_NONE:
+                ape = ape.H
+            self._shifted_ops[op, idx_p] = (p, ape)
 
-        if op == pymess.MESS_OP_NONE:
+        if op == pymess.MESS_OP_NONE or p.imag == 0:
             x = ape.apply_inverse(y)
         else:
-            x = ape.apply_inverse_adjoint(y.conj()).conj()
+            x = ape.apply_inverse(y.conj()).conj()
         return x.to_numpy().T
 
     def parameter(self, arp_p, arp_m, B=None, K=None):
@@ -2498,6 +2498,50 @@ class SecondOrderModel(Model):
             else:
                 return g[self.order:, self.order:]
 
+    @cached
+    def _sv_U_V(self, typ, mu=None):
+        """Compute second-order singular values and vectors.
+
+        .. note::
+            Assumes the system is asymptotically stable.
+
+        Parameters
+        ----------
+        typ
+            The type of the singular values:
+
+            - `'p'`: position singular values,
+            - `'v'`: velocity singular values,
+            - `'pv'`: position-velocity singular values,
+            - `'vp'`: velocity-position singular values.
+        mu
+            |Parameter values|.
+
+        Returns
+        -------
+        sv
+            One-dimensional |NumPy array| of singular values.
+        Uh
+            |NumPy array| of left singular vectors as rows.
+        Vh
+            |NumPy array| of right singular vectors as rows.
+        """
+        if not isinstance(mu, Mu):
+            mu = self.parameters.parse(mu)
+        assert self.parameters.assert_compatible(mu)
+        if typ == 'p':
+            X = self.gramian('po_lrcf', mu=mu).inner(self.gramian('pc_lrcf', mu=mu))
+        elif typ == 'v':
+            X = self.M.apply2(self.gramian('vo_lrcf', mu=mu), self.gramian('vc_lrcf', mu=mu), mu=mu)
+        elif typ == 'pv':
+            X = self.M.apply2(self.gramian('vo_lrcf', mu=mu), self.gramian('pc_lrcf', mu=mu), mu=mu)
+        elif typ == 'vp':
+            X = self.gramian('po_lrcf', mu=mu).inner(self.gramian('vc_lrcf', mu=mu))
+        else:
+            raise ValueError(f'Unknown typ ({typ}).')
+        U, sv, Vh = spla.svd(X, full_matrices=False, lapack_driver='gesvd')
+        return sv, U.T, Vh
+
     def psv(self, mu=None):
         """Position singular values.
 
@@ -660,6 +660,17 @@ class IdentityOperator(Operator):
         assert V in self.range
         return V.copy()
 
+    def apply2(self, V, U, mu=None):
+        assert V in self.range
+        assert U in self.source
+        return V.inner(U)
+
+    def pairwise_apply2(self, V, U, mu=None):
+        assert V in self.range
+        assert U in self.source
+        assert len(U) == len(V)
+        return V.pairwise_inner(U)
+
     def apply_inverse(self, V, mu=None, initial_guess=None, least_squares=False):
         assert V in self.range
         assert initial_guess is None or initial_guess in self.source and len(initial_guess) == len(V)
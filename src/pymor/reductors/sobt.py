@@ -43,8 +43,8 @@ class GenericSOBTpvReductor(BasicObject):
         """Return Gramians."""
         raise NotImplementedError
 
-    def _projection_matrices_and_singular_values(self, r, gramians):
-        """Return projection matrices and singular values."""
+    def _projection_coefficients_and_singular_values(self, r, gramians):
+        """Return Gramian factors with projection coefficients and singular values."""
         raise NotImplementedError
 
     def reduce(self, r, projection='bfsr'):
@@ -79,12 +79,14 @@ class GenericSOBTpvReductor(BasicObject):
             raise ValueError('r needs to be smaller than the sizes of Gramian factors.')
 
         # compute projection matrices
-        self.V, self.W, singular_values = self._projection_matrices_and_singular_values(r, gramians)
+        cf, V_coeffs, of, W_coeffs, singular_values = self._projection_coefficients_and_singular_values(r, gramians)
         if projection == 'sr':
             alpha = 1 / np.sqrt(singular_values[:r])
-            self.V.scal(alpha)
-            self.W.scal(alpha)
-        elif projection == 'bfsr':
+            V_coeffs = V_coeffs * alpha[:, np.newaxis]
+            W_coeffs = W_coeffs * alpha[:, np.newaxis]
+        self.V = cf.lincomb(V_coeffs)
+        self.W = of.lincomb(W_coeffs)
+        if projection == 'bfsr':
             gram_schmidt(self.V, atol=0, rtol=0, copy=False)
             gram_schmidt(self.W, atol=0, rtol=0, copy=False)
         elif projection == 'biorth':
@@ -125,12 +127,11 @@ class SOBTpReductor(GenericSOBTpvReductor):
         vof = self.fom.gramian('vo_lrcf', mu=self.mu)
         return pcf, pof, vcf, vof
 
-    def _projection_matrices_and_singular_values(self, r, gramians):
+    def _projection_coefficients_and_singular_values(self, r, gramians):
         pcf, pof, vcf, vof = gramians
-        _, sp, Vp = spla.svd(pof.inner(pcf), lapack_driver='gesvd')
-        Uv, _, _ = spla.svd(vof.inner(vcf, product=self.fom.M), lapack_driver='gesvd')
-        Uv = Uv.T
-        return pcf.lincomb(Vp[:r]), vof.lincomb(Uv[:r]), sp
+        sp, _, Vp = self.fom._sv_U_V('p', mu=self.mu)
+        _, Uv, _ = self.fom._sv_U_V('v', mu=self.mu)
+        return pcf, Vp[:r], vof, Uv[:r], sp
 
 
 class SOBTvReductor(GenericSOBTpvReductor):
@@ -151,11 +152,10 @@ class SOBTvReductor(GenericSOBTpvReductor):
         vof = self.fom.gramian('vo_lrcf', mu=self.mu)
         return vcf, vof
 
-    def _projection_matrices_and_singular_values(self, r, gramians):
+    def _projection_coefficients_and_singular_values(self, r, gramians):
         vcf, vof = gramians
-        Uv, sv, Vv = spla.svd(vof.inner(vcf, product=self.fom.M), lapack_driver='gesvd')
-        Uv = Uv.T
-        return vcf.lincomb(Vv[:r]), vof.lincomb(Uv[:r]), sv
+        sv, Uv, Vv = self.fom._sv_U_V('v', mu=self.mu)
+        return vcf, Vv[:r], vof, Uv[:r], sv
 
 
 class SOBTpvReductor(GenericSOBTpvReductor):
@@ -176,11 +176,10 @@ class SOBTpvReductor(GenericSOBTpvReductor):
         vof = self.fom.gramian('vo_lrcf', mu=self.mu)
         return pcf, vof
 
-    def _projection_matrices_and_singular_values(self, r, gramians):
+    def _projection_coefficients_and_singular_values(self, r, gramians):
         pcf, vof = gramians
-        Upv, spv, Vpv = spla.svd(vof.inner(pcf, product=self.fom.M), lapack_driver='gesvd')
-        Upv = Upv.T
-        return pcf.lincomb(Vpv[:r]), vof.lincomb(Upv[:r]), spv
+        spv, Upv, Vpv = self.fom._sv_U_V('pv', mu=self.mu)
+        return pcf, Vpv[:r], vof, Upv[:r], spv
 
 
 class SOBTvpReductor(GenericSOBTpvReductor):
@@ -202,12 +201,11 @@ class SOBTvpReductor(GenericSOBTpvReductor):
         vof = self.fom.gramian('vo_lrcf', mu=self.mu)
         return pof, vcf, vof
 
-    def _projection_matrices_and_singular_values(self, r, gramians):
+    def _projection_coefficients_and_singular_values(self, r, gramians):
         pof, vcf, vof = gramians
-        Uv, _, _ = spla.svd(vof.inner(vcf, product=self.fom.M), lapack_driver='gesvd')
-        Uv = Uv.T
-        _, svp, Vvp = spla.svd(pof.inner(vcf), lapack_driver='gesvd')
-        return vcf.lincomb(Vvp[:r]), vof.lincomb(Uv[:r]), svp
+        _, Uv, _ = self.fom._sv_U_V('v', mu=self.mu)
+        svp, _, Vvp = self.fom._sv_U_V('vp', mu=self.mu)
+        return vcf, Vvp[:r], vof, Uv[:r], svp
 
 
 class SOBTfvReductor(BasicObject):
@@ -267,14 +265,15 @@ class SOBTfvReductor(BasicObject):
             raise ValueError('r needs to be smaller than the sizes of Gramian factors.')
 
         # find necessary SVDs
-        _, sp, Vp = spla.svd(pof.inner(pcf), lapack_driver='gesvd')
+        sp, _, Vp = self.fom._sv_U_V('p', mu=self.mu)
 
         # compute projection matrices
-        self.V = pcf.lincomb(Vp[:r])
+        V_coeffs = Vp[:r]
         if projection == 'sr':
             alpha = 1 / np.sqrt(sp[:r])
-            self.V.scal(alpha)
-        elif projection == 'bfsr':
+            V_coeffs = V_coeffs * alpha[:, np.newaxis]
+        self.V = pcf.lincomb(V_coeffs)
+        if projection == 'bfsr':
             gram_schmidt(self.V, atol=0, rtol=0, copy=False)
         elif projection == 'biorth':
             gram_schmidt(self.V, product=self.fom.M, atol=0, rtol=0, copy=False)
@@ -355,23 +354,23 @@ class SOBTReductor(BasicObject):
             raise ValueError('r needs to be smaller than the sizes of Gramian factors.')
 
         # find necessary SVDs
-        Up, sp, Vp = spla.svd(pof.inner(pcf), lapack_driver='gesvd')
-        Up = Up.T
-        Uv, sv, Vv = spla.svd(vof.inner(vcf, product=self.fom.M), lapack_driver='gesvd')
-        Uv = Uv.T
+        sp, Up, Vp = self.fom._sv_U_V('p', mu=self.mu)
+        sv, Uv, Vv = self.fom._sv_U_V('v', mu=self.mu)
 
         # compute projection matrices and find the reduced model
-        self.V1 = pcf.lincomb(Vp[:r])
-        self.W1 = pof.lincomb(Up[:r])
-        self.V2 = vcf.lincomb(Vv[:r])
-        self.W2 = vof.lincomb(Uv[:r])
+        Vp, Up, Vv, Uv = Vp[:r], Up[:r], Vv[:r], Uv[:r]
         if projection == 'sr':
             alpha1 = 1 / np.sqrt(sp[:r])
-            self.V1.scal(alpha1)
-            self.W1.scal(alpha1)
+            Vp = Vp * alpha1[:, np.newaxis]
+            Up = Up * alpha1[:, np.newaxis]
             alpha2 = 1 / np.sqrt(sv[:r])
-            self.V2.scal(alpha2)
-            self.W2.scal(alpha2)
+            Vv = Vv * alpha2[:, np.newaxis]
+            Uv = Uv * alpha2[:, np.newaxis]
+        self.V1 = pcf.lincomb(Vp)
+        self.W1 = pof.lincomb(Up)
+        self.V2 = vcf.lincomb(Vv)
+        self.W2 = vof.lincomb(Uv)
+        if projection == 'sr':
             W1TV1invW1TV2 = self.W1.inner(self.V2)
             projected_ops = {'M': IdentityOperator(NumpyVectorSpace(r))}
         elif projection == 'bfsr':
@@ -380,12 +379,15 @@ class SOBTReductor(BasicObject):
             gram_schmidt(self.V2, atol=0, rtol=0, copy=False)
             gram_schmidt(self.W2, atol=0, rtol=0, copy=False)
             W1TV1invW1TV2 = spla.solve(self.W1.inner(self.V1), self.W1.inner(self.V2))
+            # V2 and W2 are orthonormalized separately, so the projected M is not the identity,
+            # even if M is
             projected_ops = {'M': project(self.fom.M, range_basis=self.W2, source_basis=self.V2)}
         elif projection == 'biorth':
             gram_schmidt_biorth(self.V1, self.W1, copy=False)
             gram_schmidt_biorth(self.V2, self.W2, product=self.fom.M, copy=False)
             W1TV1invW1TV2 = self.W1.inner(self.V2)
             projected_ops = {'M': IdentityOperator(NumpyVectorSpace(r))}
+        V1W1TV1invW1TV2 = self.V1.lincomb(W1TV1invW1TV2.T)
 
         projected_ops.update({
             'E': project(self.fom.E.assemble(mu=self.mu),
@@ -393,13 +395,13 @@ class SOBTReductor(BasicObject):
                          source_basis=self.V2),
             'K': project(self.fom.K.assemble(mu=self.mu),
                          range_basis=self.W2,
-                         source_basis=self.V1.lincomb(W1TV1invW1TV2.T)),
+                         source_basis=V1W1TV1invW1TV2),
             'B': project(self.fom.B.assemble(mu=self.mu),
                          range_basis=self.W2,
                          source_basis=None),
             'Cp': project(self.fom.Cp.assemble(mu=self.mu),
                           range_basis=None,
-                          source_basis=self.V1.lincomb(W1TV1invW1TV2.T)),
+                          source_basis=V1W1TV1invW1TV2),
             'Cv': project(self.fom.Cv.assemble(mu=self.mu),
                           range_basis=None,
                           source_basis=self.V2),
@@ -73,7 +73,12 @@ class NumpyVectorArrayImpl(VectorArrayImpl):
                 self._array = self._array.astype(np.promote_types(self._array.dtype, other_array.dtype))
             self._array[self._len:self._len + len_other] = other_array
         else:
-            self._array = np.append(self._array[:self._len], other_array, axis=0)
+            # grow geometrically, such that repeated appends take amortized linear time
+            new_array = np.empty((max(self._len + len_other, 2 * self._len), self._array.shape[1]),
+                                 dtype=np.promote_types(self._array.dtype, other_array.dtype))
+            new_array[:self._len] = self._array[:self._len]
+            new_array[self._len:self._len + len_other] = other_array
+            self._array = new_array
         self._len += len_other
 
         if remove_from_other:
@@ -9,6 +9,7 @@ import pytest
 import scipy.linalg as spla
 import scipy.sparse as sps
 
+from pymor.algorithms.lradi import _projected_eigvals, lyap_lrcf_solver_options, solve_lyap_lrcf
 from pymor.algorithms.lyapunov import (
     solve_cont_lyap_dense,
     solve_cont_lyap_lrcf,
@@ -145,6 +146,37 @@ def test_cont_lrcf(n, m, with_E, trans, lyap_solver):
     assert relative_residual(A, E, B, Z @ Z.T, trans=trans, cont_time=True) < 1e-10
 
 
+@pytest.mark.parametrize('with_E', [False, True])
+@pytest.mark.parametrize('trans', [False, True])
+@pytest.mark.parametrize('max_cached_ops', [0, 20])
+@pytest.mark.parametrize('shifts', ['wachspress_shifts', 'projection_shifts'])
+def test_lradi(shifts, max_cached_ops, trans, with_E):
+    n = 300
+    # Wachspress shifts assume a symmetric problem and are cycled due to the loose wachspress_tol,
+    # strong convection gives complex projection shifts
+    b = 0 if shifts == 'wachspress_shifts' else 200
+    if not with_E:
+        A = conv_diff_1d_fd(n, 1, b)
+        E = None
+    else:
+        A, E = conv_diff_1d_fem(n, 1, b)
+    B = np.random.randn(n, 2)
+    if trans:
+        B = B.T
+
+    Aop = NumpyMatrixOperator(A)
+    Eop = NumpyMatrixOperator(E) if with_E else None
+    Bva = Aop.source.from_numpy(B.T if not trans else B)
+
+    options = lyap_lrcf_solver_options(lradi_shifts=shifts, lradi_max_cached_ops=max_cached_ops,
+                                       wachspress_tol=1e-2)['lradi']
+    Zva = solve_lyap_lrcf(Aop, Eop, Bva, trans=trans, options=options)
+    assert len(Zva) <= n
+
+    Z = Zva.to_numpy().T
+    assert relative_residual(A, E, B, Z @ Z.T, trans=trans, cont_time=True) < 1e-10
+
+
 @pytest.mark.parametrize('n', n_list_small)
 @pytest.mark.parametrize('m', m_list)
 @pytest.mark.parametrize('with_E', [False, True])
@@ -212,3 +244,61 @@ def test_disc_dense(n, m, with_E, trans, lyap_solver):
     assert type(X) is np.ndarray
 
     assert relative_residual(A, E, B, X, trans=trans, cont_time=False) < 1e-10
+
+
+@pytest.mark.parametrize('E_type', ['spd', 'indefinite', 'nonsymmetric'])
+def test_projected_eigvals(E_type):
+    n, k = 20, 6
+    A = np.random.randn(n, n)
+    if E_type == 'spd':
+        E = np.random.randn(n, n)
+        E = E @ E.T + n * np.eye(n)
+        Q = spla.qr(np.random.randn(n, k), mode='economic')[0]
+    elif E_type == 'indefinite':
+        E = np.diag(np.arange(1, n + 1) * (-1.) ** np.arange(n))
+        Q = np.eye(n)[:, :k]
+    else:
+        E = np.eye(n) + np.random.randn(n, n) / n
+        Q = spla.qr(np.random.randn(n, k), mode='economic')[0]
+
+    Aop = NumpyMatrixOperator(A)
+    Eop = NumpyMatrixOperator(E)
+    Qva = Aop.source.from_numpy(Q.T)
+
+    ev = _projected_eigvals(Aop, Eop, Qva)
+    ev_ref = spla.eigvals(Aop.apply2(Qva, Qva), Eop.apply2(Qva, Qva))
+    assert len(ev) == len(ev_ref)
+    assert np.all(np.min(np.abs(ev[:, np.newaxis] - ev_ref[np.newaxis, :]), axis=1)
+                  <= 1e-10 * np.abs(ev_ref).max())
+
+
+@pytest.mark.parametrize('equation', ['lyap', 'ricc'])
+@skip_if_missing('PYMESS')
+def test_pymess_apeinv_apply(equation):
+    import pymess
+
+    from pymor.bindings.pymess import LyapunovEquation, RiccatiEquation
+
+    n = 20
+    A, E = conv_diff_1d_fem(n, 1, 0.1)
+    Aop = NumpyMatrixOperator(A)
+    Eop = NumpyMatrixOperator(E)
+    B = Aop.source.random(2)
+    if equation == 'lyap':
+        eqn = LyapunovEquation(pymess.Options(), Aop, Eop, B)
+    else:
+        eqn = RiccatiEquation(pymess.Options(), Aop, Eop, B, B)
+    y = np.random.randn(n, 2)
+    A, E = A.toarray(), E.toarray()
+
+    # cached entries are rebuilt when pymess passes a different shift for the same index
+    # and reused when the shift is the same
+    for op in (pymess.MESS_OP_NONE, pymess.MESS_OP_TRANSPOSE):
+        prev_p, prev_ape = None, None
+        for p in (-1., -2. + 1j, -3. + 2j, -3. + 2j):
+            x = eqn.apeinv_apply(op, p, 0, y)
+            ApE = A + p * E if op == pymess.MESS_OP_NONE else (A + p * E).T
+            assert np.allclose(ApE @ x, y)
+            ape = eqn._shifted_ops[op, 0][1]
+            assert (ape is prev_ape) == (p == prev_p)
+            prev_p, prev_ape = p, ape
@@ -0,0 +1,49 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import numpy as np
+import pytest
+import scipy.linalg as spla
+
+from pymor.models.iosys import SecondOrderModel
+from pymor.operators.constructions import IdentityOperator
+
+
+def get_model(identity_M):
+    rng = np.random.default_rng(0)
+    n = 12
+    M = np.eye(n) + np.diag(rng.random(n))
+    K = np.diag(np.arange(1., n + 1)) + 0.1 * rng.standard_normal((n, n))
+    K = K @ K.T
+    E = 0.1 * K + 0.2 * M
+    B = rng.standard_normal((n, 2))
+    Cp = rng.standard_normal((3, n))
+    Cv = rng.standard_normal((3, n))
+    so = SecondOrderModel.from_matrices(M, E, K, B, Cp, Cv)
+    if identity_M:
+        so = so.with_(M=IdentityOperator(so.M.source))
+    return so
+
+
+def gramian_product(so, typ):
+    pcf = so.gramian('pc_lrcf')
+    pof = so.gramian('po_lrcf')
+    vcf = so.gramian('vc_lrcf')
+    vof = so.gramian('vo_lrcf')
+    return {'p': pof.inner(pcf),
+            'v': vof.inner(vcf, product=so.M),
+            'pv': vof.inner(pcf, product=so.M),
+            'vp': pof.inner(vcf)}[typ]
+
+
+@pytest.mark.parametrize('identity_M', [False, True])
+@pytest.mark.parametrize('typ', ['p', 'v', 'pv', 'vp'])
+def test_sv_U_V(typ, identity_M):
+    so = get_model(identity_M)
+    sv, U, Vh = so._sv_U_V(typ)
+    X = gramian_product(so, typ)
+    assert np.allclose(sv, spla.svdvals(X), rtol=1e-10, atol=1e-12 * sv[0])
+    assert np.allclose(U.T * sv @ Vh, X, rtol=0, atol=1e-10 * sv[0])
+    assert np.allclose(U @ U.T, np.eye(len(U)))
+    assert np.allclose(Vh @ Vh.T, np.eye(len(Vh)))
@@ -0,0 +1,103 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import numpy as np
+import pytest
+import scipy.linalg as spla
+
+from pymor.algorithms.gram_schmidt import gram_schmidt, gram_schmidt_biorth
+from pymor.algorithms.projection import project
+from pymor.models.iosys import SecondOrderModel
+from pymor.reductors.basic import SOLTIPGReductor
+from pymor.reductors.sobt import (
+    SOBTfvReductor,
+    SOBTpReductor,
+    SOBTpvReductor,
+    SOBTReductor,
+    SOBTvpReductor,
+    SOBTvReductor,
+)
+from pymortests.models.iosys_sobt import get_model, gramian_product
+
+r = 4
+generic_reductors = {
+    'p': SOBTpReductor,
+    'v': SOBTvReductor,
+    'pv': SOBTpvReductor,
+    'vp': SOBTvpReductor,
+}
+
+
+def reference_rom(so, reductor, projection):
+    """Reduce `so` by computing all SVDs directly from the Gramian factor products."""
+    pcf = so.gramian('pc_lrcf')
+    pof = so.gramian('po_lrcf')
+    vcf = so.gramian('vc_lrcf')
+    vof = so.gramian('vo_lrcf')
+    Up, sp, Vp = spla.svd(gramian_product(so, 'p'))
+    Uv, sv, Vv = spla.svd(gramian_product(so, 'v'))
+
+    if reductor in ('p', 'v', 'pv', 'vp', 'fv'):
+        if reductor == 'p':
+            V, W, s = pcf.lincomb(Vp[:r]), vof.lincomb(Uv.T[:r]), sp
+        elif reductor == 'v':
+            V, W, s = vcf.lincomb(Vv[:r]), vof.lincomb(Uv.T[:r]), sv
+        elif reductor == 'pv':
+            Upv, spv, Vpv = spla.svd(gramian_product(so, 'pv'))
+            V, W, s = pcf.lincomb(Vpv[:r]), vof.lincomb(Upv.T[:r]), spv
+        elif reductor == 'vp':
+            _, svp, Vvp = spla.svd(gramian_product(so, 'vp'))
+            V, W, s = vcf.lincomb(Vvp[:r]), vof.lincomb(Uv.T[:r]), svp
+        else:
+            V, s = pcf.lincomb(Vp[:r]), sp
+            W = V
+        if projection == 'sr':
+            V.scal(1 / np.sqrt(s[:r]))
+            if W is not V:
+                W.scal(1 / np.sqrt(s[:r]))
+        elif projection == 'bfsr':
+            gram_schmidt(V, atol=0, rtol=0, copy=False)
+            if W is not V:
+                gram_schmidt(W, atol=0, rtol=0, copy=False)
+        return SOLTIPGReductor(so, W, V).reduce()
+
+    V1, W1 = pcf.lincomb(Vp[:r]), pof.lincomb(Up.T[:r])
+    V2, W2 = vcf.lincomb(Vv[:r]), vof.lincomb(Uv.T[:r])
+    if projection == 'sr':
+        V1.scal(1 / np.sqrt(sp[:r]))
+        W1.scal(1 / np.sqrt(sp[:r]))
+        V2.scal(1 / np.sqrt(sv[:r]))
+        W2.scal(1 / np.sqrt(sv[:r]))
+    elif projection == 'bfsr':
+        for X in (V1, W1, V2, W2):
+            gram_schmidt(X, atol=0, rtol=0, copy=False)
+    else:
+        gram_schmidt_biorth(V1, W1, copy=False)
+        gram_schmidt_biorth(V2, W2, product=so.M, copy=False)
+    V1W1TV1invW1TV2 = V1.lincomb(spla.solve(W1.inner(V1), W1.inner(V2)).T)
+    return SecondOrderModel(project(so.M, W2, V2), project(so.E, W2, V2), project(so.K, W2, V1W1TV1invW1TV2),
+                            project(so.B, W2, None), project(so.Cp, None, V1W1TV1invW1TV2),
+                            project(so.Cv, None, V2), so.D)
+
+
+@pytest.mark.parametrize('identity_M', [False, True])
+@pytest.mark.parametrize('projection', ['sr', 'bfsr', 'biorth'])
+@pytest.mark.parametrize('reductor', ['p', 'v', 'pv', 'vp', 'fv', 'sobt'])
+def test_sobt_reductors(reductor, projection, identity_M):
+    if projection == 'biorth' and reductor != 'sobt':
+        pytest.skip('SOLTIPGReductor cannot build reduced models with biorthonormal bases.')
+    so = get_model(identity_M)
+    if reductor in generic_reductors:
+        rom = generic_reductors[reductor](so).reduce(r, projection=projection)
+    elif reductor == 'fv':
+        rom = SOBTfvReductor(so).reduce(r, projection=projection)
+    else:
+        rom = SOBTReductor(so).reduce(r, projection=projection)
+    assert isinstance(rom, SecondOrderModel) and rom.order == r
+
+    rom_ref = reference_rom(so, reductor, projection)
+    w = np.logspace(-2, 2, 10)
+    H = rom.transfer_function.freq_resp(w)
+    H_ref = rom_ref.transfer_function.freq_resp(w)
+    assert np.allclose(H, H_ref, rtol=1e-8, atol=1e-10 * np.abs(H_ref).max())